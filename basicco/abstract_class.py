@@ -66,16 +66,20 @@ class AbstractMeta(abc.ABCMeta):
     def __gather_abstract_members(cls):
         # type: () -> None
 
-        # Iterate over MRO of the class.
+        # Iterate over MRO of the class (subclasses first, so overrides win).
+        member_names = set()  # type: Set[str]
         abstract_method_names = set()  # type: Set[str]
-        for base in reversed(get_mro(cls)):
+        for base in get_mro(cls):
             # Find abstract members.
             for member_name, member in six.iteritems(base.__dict__):
+                # Skip members overridden by a previous class in the MRO.
+                if member_name in member_names:
+                    continue
+                member_names.add(member_name)
+
                 # Keep track.
                 if is_abstract(member):
                     abstract_method_names.add(member_name)
-                else:
-                    abstract_method_names.discard(member_name)
 
         # Update class information.
         type.__setattr__(cls, _ABSTRACT_METHODS, frozenset(abstract_method_names))
@@ -63,8 +63,7 @@ def make_cls(
         def exec_body(namespace):
             # type: (Dict[str, Any]) -> Dict[str, Any]
             """Construct class body."""
-            for key, value in six.iteritems(dct_):
-                namespace[key] = value
+            namespace.update(dct_)
             return namespace
 
         assert bases is not None
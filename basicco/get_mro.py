@@ -63,13 +63,19 @@ def get_mro(cls):
     # Resolve generic class to its origin.
     cls = resolve_origin(cls)
 
+    # Use the native mro directly if available (old-style classes don't have it).
+    try:
+        cls_mro = cls.__mro__
+    except AttributeError:
+        cls_mro = inspect.getmro(cls)
+
     # Newer python versions.
     if GenericMeta is type:
-        return tuple(inspect.getmro(cls))
+        return cls_mro
 
     # Special logic to skip generic classes when GenericMeta is being used (old python).
     mro = collections.deque()  # type: Deque[Type[Any]]
-    for base in reversed(inspect.getmro(cls)):
+    for base in reversed(cls_mro):
         origin = resolve_origin(base)
         if origin in mro:
             continue
@@ -17,7 +17,7 @@ def mangle(name, cls_name):
     :return: Mangled name.
     """
     if name.startswith("__") and not name.endswith("__"):
-        return "_{}{}".format(cls_name.lstrip("_"), name)
+        return "_" + cls_name.lstrip("_") + name
     return name
 
 
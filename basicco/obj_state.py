@@ -2,9 +2,22 @@
 
 import sys
 import types
+import weakref
 
 import six
-from tippo import Any, Callable, Dict, Mapping, Set, Tuple, Type, TypeVar, Union, cast
+from tippo import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from basicco.dynamic_code import generate_unique_filename, make_function
 from basicco.get_mro import get_mro
@@ -16,6 +29,76 @@ __all__ = ["get_state", "update_state", "reducer", "ReducibleMeta", "Reducible"]
 
 _T = TypeVar("_T")
 
+_slot_members_cache = (
+    weakref.WeakKeyDictionary()
+)  # type: weakref.WeakKeyDictionary[Type[Any], Tuple[Tuple[str, Any], ...]]
+
+
+def _get_slot_members(cls):
+    # type: (Type[Any]) -> Tuple[Tuple[str, Any], ...]
+    slot_members = _slot_members_cache.get(cls)
+    if slot_members is not None:
+        return slot_members
+
+    # Collect (mangled) slot names and their member descriptors from the MRO once.
+    slots = set()  # type: Set[str]
+    slot_members_list = []  # type: List[Tuple[str, Any]]
+    for base in get_mro(cls):
+        # Skip object.
+        if base is object:
+            continue
+
+        # Only slots declared by this base (a single string is a valid declaration).
+        base_slots = base.__dict__.get("__slots__", ())
+        if isinstance(base_slots, six.string_types):
+            base_slots = (base_slots,)
+
+        for slot in base_slots:
+            # Skip weak reference slot.
+            if slot == "__weakref__":
+                continue
+
+            # Mangle slot if needed.
+            slot = mangle(slot, base.__name__)
+
+            # Skip if already collected or not a slot in this base.
+            if slot in slots or slot not in base.__dict__:
+                continue
+
+            slots.add(slot)
+            slot_members_list.append((slot, base.__dict__[slot]))
+
+    slot_members = _slot_members_cache[cls] = tuple(slot_members_list)
+    return slot_members
+
+
+_slot_descriptors_cache = (
+    weakref.WeakKeyDictionary()
+)  # type: weakref.WeakKeyDictionary[Type[Any], Dict[str, Any]]
+
+
+def _get_slot_descriptors(cls):
+    # type: (Type[Any]) -> Dict[str, Any]
+    slot_descriptors = _slot_descriptors_cache.get(cls)
+    if slot_descriptors is not None:
+        return slot_descriptors
+
+    # Map names to the first member descriptor found in the MRO.
+    slot_descriptors = {}
+    for base in get_mro(cls):
+        # Skip object.
+        if base is object:
+            continue
+
+        for name, member in base.__dict__.items():
+            if name not in slot_descriptors and isinstance(
+                member, types.MemberDescriptorType
+            ):
+                slot_descriptors[name] = member
+
+    _slot_descriptors_cache[cls] = slot_descriptors
+    return slot_descriptors
+
 
 def get_state(obj):
     # type: (Any) -> Dict[str, Any]
@@ -31,33 +114,16 @@ def get_state(obj):
     # Get slotted values.
     if not isinstance(obj, type) and hasattr(type(obj), "__slots__"):
         cls = type(obj)
-        for base in get_mro(cls):
-            # Skip object.
-            if base is object:
-                continue
-
-            # Get slot values.
-            for slot in getattr(base, "__slots__", ()):
-                # Skip weak reference slot.
-                if slot == "__weakref__":
-                    continue
-
-                # Mangle slot if needed.
-                slot = mangle(slot, base.__name__)
-
-                # Skip if already has a value.
-                if slot in state:
-                    continue
-
-                # Try to get value using the member descriptor.
-                try:
-                    state[slot] = base.__dict__[slot].__get__(obj, cls)
-                except (KeyError, AttributeError):
-                    pass
+        for slot, member in _get_slot_members(cls):
+            # Try to get value using the member descriptor.
+            try:
+                state[slot] = member.__get__(obj, cls)
+            except AttributeError:
+                pass
 
     # Get normal values.
     if hasattr(obj, "__dict__"):
-        state.update(dict(obj.__dict__))
+        state.update(obj.__dict__)
 
     return state
 
@@ -71,37 +137,67 @@ def update_state(obj, state_update):
     :param obj: Object instance or class.
     :param state_update: Dictionary with state updates.
     """
-    remaining = set(state_update)  # type: Set[str]
-
-    # Set slotted attributes.
-    if not isinstance(obj, type) and hasattr(type(obj), "__slots__"):
-        cls = type(obj)
-        for base in get_mro(cls):
-            # Nothing left to do.
-            if not remaining:
-                return
-
-            # Skip object.
-            if base is object:
-                continue
 
-            # Set slot values.
-            for slot in tuple(remaining):
-                # Skip if not a slot in this base.
-                member = base.__dict__.get(slot)
-                if not isinstance(member, types.MemberDescriptorType):
-                    continue
+    # Class, set attributes normally.
+    if isinstance(obj, type):
+        for name, value in six.iteritems(state_update):
+            type.__setattr__(obj, name, value)
+        return
+
+    # Set slotted attributes using their member descriptors.
+    cls = type(obj)
+    if hasattr(cls, "__slots__"):
+        slot_descriptors = _get_slot_descriptors(cls)
+        for name, value in six.iteritems(state_update):
+            slot_descriptor = slot_descriptors.get(name)
+            if slot_descriptor is not None:
+                slot_descriptor.__set__(obj, value)
+            else:
+                object.__setattr__(obj, name, value)
+        return
+
+    # Set attributes normally.
+    for name, value in six.iteritems(state_update):
+        object.__setattr__(obj, name, value)
+
+
+# Path (or None if not importable), module name and attribute names per class.
+_ReducerPath = Tuple[Union[str, None], str, Tuple[str, ...]]
+_reducer_paths_cache = (
+    weakref.WeakKeyDictionary()
+)  # type: weakref.WeakKeyDictionary[Type[Any], _ReducerPath]
+
+
+def _get_reducer_cls_or_path(cls):
+    # type: (Type[_T]) -> Union[Type[_T], str]
+
+    # Only use the cached result if the class can still (or still can't) be found in
+    # its module (the module attribute could have been rebound).
+    cached = _reducer_paths_cache.get(cls)
+    if cached is not None:
+        path, module_name, attribute_names = cached
+        obj = sys.modules.get(module_name)  # type: Any
+        for attribute_name in attribute_names:
+            obj = getattr(obj, attribute_name, None)
+        if (obj is cls) is (path is not None):
+            return cls if path is None else path
 
-                # Set value using the member descriptor.
-                member.__set__(obj, state_update[slot])
-                remaining.remove(slot)
-
-    # Set remaining attributes normally.
-    for name in remaining:
-        if isinstance(obj, type):
-            type.__setattr__(obj, name, state_update[name])
-        else:
-            object.__setattr__(obj, name, state_update[name])
+    try:
+        path = get_path(cls)
+    except ImportError:
+        path = None
+
+    # Cache results that can be verified by looking up the class in its module.
+    module_name = cls.__module__
+    if path is None:
+        attribute_names = tuple(getattr(cls, "__qualname__", cls.__name__).split("."))
+    elif "[" not in path and path.startswith(module_name + "."):
+        attribute_names = tuple(path[len(module_name) + 1 :].split("."))
+    else:
+        _reducer_paths_cache.pop(cls, None)
+        return path
+    _reducer_paths_cache[cls] = path, module_name, attribute_names
+    return cls if path is None else path
 
 
 def _reducer(cls_or_path, state):
@@ -119,15 +215,9 @@ def _make_reducer(name, owner=None):
     # type: (str, Union[Type[Any], None]) -> Callable[..., _T]
     script = """def {}(self):
     \"\"\"Reducer method that supports qualified name and slots for Python 2.7.\"\"\"
-    cls = type(self)
-    try:
-        cls_or_path = get_path(cls)
-    except ImportError:
-        cls_or_path = cls
+    cls_or_path = _get_reducer_cls_or_path(type(self))
     return _reducer, (cls_or_path, get_state(self))
-""".format(
-        name
-    )
+""".format(name)
     if owner is None:
         module = __name__
         owner_name = None
@@ -137,7 +227,11 @@ def _make_reducer(name, owner=None):
     return make_function(
         name,
         script,
-        globs={"get_path": get_path, "_reducer": _reducer, "get_state": get_state},
+        globs={
+            "_get_reducer_cls_or_path": _get_reducer_cls_or_path,
+            "_reducer": _reducer,
+            "get_state": get_state,
+        },
         filename=generate_unique_filename(name, module=module, owner_name=owner_name),
         module=module,
     )
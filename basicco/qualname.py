@@ -6,18 +6,24 @@ For more information about the native Python 3 implementation, see
 """
 
 import ast
+import bisect
 import inspect
 import sys
+import threading
 
 import six
-from tippo import Any, Callable, Dict, List, Union, cast
+from tippo import Any, Callable, Dict, List, Tuple, Union, cast
 
 from basicco.mangling import mangle
 
 __all__ = ["QualnameError", "qualname", "QualnamedMeta", "Qualnamed"]
 
 
-_cache = {}  # type: Dict[str, Dict[int, str]]
+_cache = {}  # type: Dict[Tuple[str, int], str]
+_cache_linenos = {}  # type: Dict[str, Tuple[int, ...]]
+_cache_lock = threading.Lock()
+_NATIVE_QUALNAME = hasattr(type, "__qualname__")
+_TOP_LEVEL_MODULES = frozenset(("__builtin__", "builtins", "__main__", "abc", "typing"))
 
 
 class QualnameError(Exception):
@@ -71,6 +77,12 @@ def qualname(obj, fallback=None, force_ast=False, use_existing=True):
         except AttributeError:
             pass
 
+    # Objects from these modules are usually top-level, skip the import machinery.
+    if obj_module in _TOP_LEVEL_MODULES:
+        module = sys.modules.get(obj_module, None)
+        if module is not None and getattr(module, obj_name, None) is obj:
+            return obj_name
+
     # Try to match the root of the module in case the object is not nested.
     try:
         module = __import__(obj_module, fromlist=[obj_name])
@@ -129,43 +141,30 @@ def qualname(obj, fallback=None, force_ast=False, use_existing=True):
             return fallback
 
     # Parse the source file to figure out what the qualified name should be.
-    if filename in _cache:
-        qualified_names = _cache[filename]
-    else:
-        try:
-            with open(filename, "r") as fp:
-                source = fp.read()
-        except (OSError, IOError) as e:
-            if fallback is None:
-                error = "could not read source code at {!r}; {}".format(filename, e)
-                exc = QualnameError(error)
-                six.raise_from(exc, None)
-                raise exc
-            else:
-                return fallback
-        node = ast.parse(source, filename)
-        visitor = _Visitor()
-        visitor.visit(node)
-        qualified_names = _cache[filename] = visitor.qualified_names
-
-    # Sort list of line numbers based on the one found via inspection.
-    if qualified_names:
-        linenos = sorted(
-            qualified_names,
-            reverse=True,
-            key=lambda k: (
-                k - lineno if k >= lineno else max(qualified_names) + (lineno - k)
-            ),
-        )
-    else:
-        linenos = []
+    try:
+        cached_linenos = _get_cached_linenos(filename)
+    except (OSError, IOError) as e:
+        if fallback is None:
+            error = "could not read source code at {!r}; {}".format(filename, e)
+            exc = QualnameError(error)
+            six.raise_from(exc, None)
+            raise exc
+        else:
+            return fallback
+
+    # Order line numbers based on the one found via inspection (popped from the end).
+    # Line numbers at or after it come first in ascending order, then the ones before
+    # it in descending order. The cached line numbers are already sorted.
+    index = bisect.bisect_left(cached_linenos, lineno)
+    linenos = list(cached_linenos[:index])
+    linenos.extend(reversed(cached_linenos[index:]))
 
     # Iterate over possible line numbers.
     while linenos:
         current_lineno = linenos.pop()
 
         # Get qualified name from parsing results.
-        qualified_name = qualified_names.get(current_lineno, None)
+        qualified_name = _cache.get((filename, current_lineno), None)
         if qualified_name is None:
             if fallback is None:
                 error = (
@@ -207,8 +206,7 @@ def qualname(obj, fallback=None, force_ast=False, use_existing=True):
 class QualnamedMeta(type):
     """Metaclass that implements `__qualname__` for Python 2.7."""
 
-    if sys.version_info[:2] < (3, 4):
-        assert not hasattr(object, "__qualname__")
+    if not _NATIVE_QUALNAME:
 
         def __repr__(cls):
             # type: () -> str
@@ -229,7 +227,7 @@ class QualnamedMeta(type):
                 type.__setattr__(cls, attr, qualified_name)
                 return qualified_name
             try:
-                return super(QualnamedMeta, cls).__getattr__(name)  # noqa
+                return super(QualnamedMeta, cls).__getattr__(name)  # type: ignore
             except AttributeError:
                 pass
             error = "class {!r} has no attribute {!r}".format(cls.__name__, name)
@@ -240,7 +238,7 @@ class QualnamedMeta(type):
             # type: () -> str
             """Qualified name."""
             attr = mangle("__qualname", cls.__name__)
-            return getattr(cls, attr)
+            return cast(str, getattr(cls, attr))
 
         @__qualname__.setter
         def __qualname__(cls, value):
@@ -254,7 +252,7 @@ class Qualnamed(six.with_metaclass(QualnamedMeta, object)):
 
     __slots__ = ()
 
-    if sys.version_info[:2] < (3, 4):
+    if not _NATIVE_QUALNAME:
 
         def __repr__(self):
             # type: () -> str
@@ -268,6 +266,29 @@ class Qualnamed(six.with_metaclass(QualnamedMeta, object)):
             )
 
 
+def _get_cached_linenos(filename):
+    # type: (str) -> Tuple[int, ...]
+    cached_linenos = _cache_linenos.get(filename, None)
+    if cached_linenos is not None:
+        return cached_linenos
+
+    # Only one thread parses a given file, others wait for its results.
+    with _cache_lock:
+        cached_linenos = _cache_linenos.get(filename, None)
+        if cached_linenos is not None:
+            return cached_linenos
+        with open(filename, "r") as fp:
+            source = fp.read()
+        node = ast.parse(source, filename)
+        visitor = _Visitor()
+        visitor.visit(node)
+        for lineno, qualified_name in six.iteritems(visitor.qualified_names):
+            _cache[(filename, lineno)] = qualified_name
+        cached_linenos = tuple(sorted(visitor.qualified_names))
+        _cache_linenos[filename] = cached_linenos
+        return cached_linenos
+
+
 class _Visitor(ast.NodeVisitor):
     def __init__(self):
         # type: () -> None
@@ -276,12 +297,12 @@ class _Visitor(ast.NodeVisitor):
 
     def store_qualified_name(self, lineno):
         # type: (int) -> None
-        qn = ".".join(n for n in self.stack)
+        qn = six.moves.intern(".".join(self.stack))
         self.qualified_names[lineno] = qn
 
     def visit_FunctionDef(self, node):
         # type: (ast.FunctionDef) -> None
-        self.stack.append(node.name)
+        self.stack.append(six.moves.intern(node.name))
         self.store_qualified_name(node.lineno)
         self.stack.append("<locals>")
         self.generic_visit(node)
@@ -290,7 +311,7 @@ class _Visitor(ast.NodeVisitor):
 
     def visit_ClassDef(self, node):
         # type: (ast.ClassDef) -> None
-        self.stack.append(node.name)
+        self.stack.append(six.moves.intern(node.name))
         self.store_qualified_name(node.lineno)
         self.generic_visit(node)
         self.stack.pop()
@@ -1,17 +1,17 @@
 """Decorator that prevents infinite recursion for `__repr__` methods."""
 
 import functools
-import threading
 
-import six
-from tippo import Any, Callable, Counter, TypeVar, Union, overload
+from tippo import Any, Callable, Dict, TypeVar, Union, overload
+
+from basicco.context_vars import ContextVar
 
 __all__ = ["recursive_repr"]
 
 
 _T = TypeVar("_T")
 
-_reprs = threading.local()
+_reprs = ContextVar("_reprs")  # type: ContextVar[Dict[int, int]]
 
 
 @overload
@@ -48,44 +48,70 @@ def recursive_repr(maybe_func=None, max_depth=1, max_repr="..."):
     def decorator(func):
         # type: (Callable[..., _T]) -> Callable[..., _T]
 
-        @functools.wraps(func)
-        def decorated(*args, **kwargs):
-            # type: (*Any, **Any) -> Any
-
-            # Get self (or cls for class methods).
-            try:
-                self = args[0]
-            except IndexError:
-                error = "'recursive_repr' needs to decorate a class/instance method"
-                exc = RuntimeError(error)
-                six.raise_from(exc, None)
-                raise exc
-            self_id = id(self)
-
-            # Get reprs counter for current context and increment it for self.
-            had_reprs = False
-            try:
-                reprs = _reprs.reprs  # type: Counter[int]
-            except AttributeError:
-                reprs = _reprs.reprs = Counter()
-            else:
-                had_reprs = True
-            reprs[self_id] += 1
-
-            # Return representation.
-            try:
-                if max_depth is not None and reprs[self_id] > max_depth:
-                    return max_repr
+        # Bind to closure to avoid global lookups when called.
+        reprs_var = _reprs
+        get_id = id
+
+        if max_depth is None:
+
+            @functools.wraps(func)
+            def decorated(self, *args, **kwargs):
+                # type: (Any, *Any, **Any) -> Any
+                self_id = get_id(self)
+
+                # Get reprs counter for current context and increment it for self.
+                reprs = reprs_var.get(None)
+                if reprs is None:
+                    reprs = {}
+                    reprs_token = reprs_var.set(reprs)
+                else:
+                    reprs_token = None
+                depth = reprs[self_id] = reprs.get(self_id, 0) + 1
+
+                # Return representation (no maximum depth to check against).
+                try:
+                    return func(self, *args, **kwargs)
+                finally:
+                    # Decrement repr counter and clean up if needed.
+                    if depth == 1:
+                        del reprs[self_id]
+                    else:
+                        reprs[self_id] = depth - 1
+
+                    if reprs_token is not None:
+                        reprs_var.reset(reprs_token)
+
+        else:
+
+            @functools.wraps(func)
+            def decorated(self, *args, **kwargs):
+                # type: (Any, *Any, **Any) -> Any
+                self_id = get_id(self)
+
+                # Get reprs counter for current context and increment it for self.
+                reprs = reprs_var.get(None)
+                if reprs is None:
+                    reprs = {}
+                    reprs_token = reprs_var.set(reprs)
                 else:
-                    return func(*args, **kwargs)
-            finally:
-                # Decrement repr counter and clean up if needed.
-                reprs[self_id] -= 1
-                if not reprs[self_id]:
-                    del _reprs.reprs[self_id]
-
-                if not had_reprs:
-                    del _reprs.reprs
+                    reprs_token = None
+                depth = reprs[self_id] = reprs.get(self_id, 0) + 1
+
+                # Return representation.
+                try:
+                    if depth > max_depth:
+                        return max_repr
+                    else:
+                        return func(self, *args, **kwargs)
+                finally:
+                    # Decrement repr counter and clean up if needed.
+                    if depth == 1:
+                        del reprs[self_id]
+                    else:
+                        reprs[self_id] = depth - 1
+
+                    if reprs_token is not None:
+                        reprs_var.reset(reprs_token)
 
         return decorated
 
@@ -4,7 +4,7 @@ import functools
 import inspect
 
 import six
-from tippo import Any, Callable, Dict, Tuple, Type, TypeVar, Union, final
+from tippo import Any, Callable, Dict, FrozenSet, Tuple, Type, TypeVar, Union, final
 
 from basicco.get_mro import get_mro
 
@@ -37,25 +37,24 @@ globals()["final"].__doc__ = "A decorator to indicate final methods and final cl
 
 def _is_final_member(member):
     # type: (object) -> bool
-    _is_final = False
 
-    # Descriptor.
-    if hasattr(member, "__get__"):
-        _is_final |= getattr(member, _FINAL_METHOD_TAG, False)
+    # Descriptor or regular method.
+    is_descriptor = hasattr(member, "__get__")
+    if is_descriptor or callable(member):
+        if getattr(member, _FINAL_METHOD_TAG, False):
+            return True
 
-        # Has 'fget' getter (property-like).
-        if hasattr(member, "fget"):
-            _is_final |= getattr(member.fget, _FINAL_METHOD_TAG, False)
+    # Has 'fget' getter (property-like).
+    if is_descriptor:
+        fget = getattr(member, "fget", None)
+        if fget is not None and getattr(fget, _FINAL_METHOD_TAG, False):
+            return True
 
     # Static or class method.
     if isinstance(member, (staticmethod, classmethod)):
-        _is_final |= getattr(member.__func__, _FINAL_METHOD_TAG, False)
+        return bool(getattr(member.__func__, _FINAL_METHOD_TAG, False))
 
-    # Regular method.
-    if callable(member):
-        _is_final |= getattr(member, _FINAL_METHOD_TAG, False)
-
-    return _is_final
+    return False
 
 
 def is_final(obj):
@@ -66,10 +65,10 @@ def is_final(obj):
     :param obj: Class or member.
     :return: True if final.
     """
-    if inspect.isclass(obj):
-        return getattr(obj, _FINAL_CLASS_TAG, False)
-    else:
+    if not isinstance(obj, type):
         return _is_final_member(obj)
+    else:
+        return getattr(obj, _FINAL_CLASS_TAG, False)
 
 
 class RuntimeFinalMeta(type):
@@ -83,10 +82,28 @@ class RuntimeFinalMeta(type):
     def __gather_final_members(cls):
         # type: () -> None
 
+        mro = get_mro(cls)
+
+        # Fast path: no base is final or has final members, only look at own members.
+        if all(
+            base is object
+            or (
+                isinstance(base, RuntimeFinalMeta)
+                and not getattr(base, _FINAL_METHODS)
+                and getattr(base, _FINAL_CLASS_TAG, False) is not True
+            )
+            for base in mro[1:]
+        ):
+            type.__setattr__(
+                cls,
+                _FINAL_METHODS,
+                frozenset(n for n, m in mro[0].__dict__.items() if _is_final_member(m)),
+            )
+            return
+
         # Iterate over MRO of the class.
         final_cls = None  # type: Union[Type[Any], None]
         final_member_names = {}  # type: Dict[str, Type[Any]]
-        mro = get_mro(cls)
         for base in reversed(mro):
             if base is object:
                 continue
@@ -113,25 +130,53 @@ class RuntimeFinalMeta(type):
                 if _is_final_member(member):
                     final_member_names[member_name] = base
 
-            # Store final members.
-            type.__setattr__(cls, _FINAL_METHODS, frozenset(final_member_names))
+        # Store final members.
+        type.__setattr__(cls, _FINAL_METHODS, frozenset(final_member_names))
+
+    def __update_final_members(cls, name, final):
+        # type: (str, bool) -> None
+
+        # Not initialized yet (set during class creation), gather from the whole MRO.
+        if _FINAL_METHODS not in cls.__dict__:
+            cls.__gather_final_members()
+            return
+
+        # Final member defined by a base stays final (look it up in the current bases,
+        # since they can gain final members after this class was created).
+        final_in_base = False
+        for base in reversed(get_mro(cls)[1:]):
+            if name in base.__dict__ and _is_final_member(base.__dict__[name]):
+                if final:
+                    error = "{!r} overrides final member {!r} defined by {!r}".format(
+                        cls.__name__,
+                        name,
+                        base.__name__,
+                    )
+                    raise TypeError(error)
+                final_in_base = True
+                break
+
+        final_member_names = getattr(cls, _FINAL_METHODS)  # type: FrozenSet[str]
+
+        # Only add/remove the name instead of gathering from the whole MRO again.
+        if final or final_in_base:
+            final_member_names = final_member_names.union((name,))
+        else:
+            final_member_names = final_member_names.difference((name,))
+        type.__setattr__(cls, _FINAL_METHODS, final_member_names)
 
     def __setattr__(cls, name, value):
         # type: (str, Any) -> None
         super(RuntimeFinalMeta, cls).__setattr__(name, value)
-        if is_final(value):
-            cls.__gather_final_members()
+        if _is_final_member(value):
+            cls.__update_final_members(name, True)
 
     def __delattr__(cls, name):
         # type: (str) -> None
-        gather = False
-        for base in get_mro(cls):
-            if name in base.__dict__:
-                gather = is_final(base.__dict__[name])
-                break
+        update = name in cls.__dict__ and _is_final_member(cls.__dict__[name])
         super(RuntimeFinalMeta, cls).__delattr__(name)
-        if gather:
-            cls.__gather_final_members()
+        if update:
+            cls.__update_final_members(name, False)
 
 
 class RuntimeFinal(six.with_metaclass(RuntimeFinalMeta, object)):
@@ -14,6 +14,19 @@ from basicco.dynamic_code import generate_unique_filename, make_function
 __all__ = ["SafeNotEqualsMeta", "SafeNotEquals"]
 
 
+if sys.version_info[:1] < (3,):
+    # Compile the '__ne__' function only once, classes share it.
+    _NE_FUNC_NAME = "__ne__"
+    _NE_FUNC = make_function(
+        name=_NE_FUNC_NAME,
+        script="def __ne__(self, other):\n    return not (self == other)",
+        globs={},
+        filename=generate_unique_filename(_NE_FUNC_NAME, module=__name__),
+        module=__name__,
+    )
+    _NE_FUNC = functools.wraps(object.__ne__)(_NE_FUNC)
+
+
 class SafeNotEqualsMeta(type):
     """Backports the default Python 3 behavior of `__ne__`."""
 
@@ -30,20 +43,7 @@ class SafeNotEqualsMeta(type):
             # type: (...) -> _SNEM
             cls = super(SafeNotEqualsMeta, mcs).__new__(mcs, name, bases, dct, **kwargs)
             if cls.__ne__ is object.__ne__:
-                script = "def __ne__(self, other):\n    return not (self == other)"
-                func_name = "__ne__"
-                module = dct.get("__module__", None)
-                func = make_function(
-                    name=func_name,
-                    script=script,
-                    globs={},
-                    filename=generate_unique_filename(
-                        func_name, module=module, owner_name=name
-                    ),
-                    module=module,
-                )
-                func = functools.wraps(object.__ne__)(func)
-                type.__setattr__(cls, func_name, func)
+                type.__setattr__(cls, _NE_FUNC_NAME, _NE_FUNC)
             return cls
 
 
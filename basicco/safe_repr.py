@@ -8,10 +8,12 @@ import traceback
 
 from tippo import Any, Callable, overload
 
+from basicco.context_vars import ContextVar
+
 __all__ = ["default_alternative_repr", "safe_repr"]
 
 
-_in_repr = False
+_in_repr = ContextVar("_in_repr", default=False)  # type: ContextVar[bool]
 
 
 def default_alternative_repr(obj):
@@ -53,22 +55,24 @@ def safe_repr(maybe_func=None, alternative_repr=default_alternative_repr):
     def decorator(func):
         # type: (Callable[..., str]) -> Callable[..., str]
 
+        # Bind to closure to avoid global lookups when called.
+        in_repr_var = _in_repr
+
         @functools.wraps(func)
         def decorated(self, *args, **kwargs):
             # type: (Any, *Any, **Any) -> Any
-            global _in_repr
-            before = _in_repr
-            if not before:
-                _in_repr = True
+
+            # Already inside another safe repr, let it handle exceptions.
+            if in_repr_var.get():
+                return func(self, *args, **kwargs)
+
+            in_repr_token = in_repr_var.set(True)
             try:
                 return func(self, *args, **kwargs)  # noqa
             except Exception:  # noqa
-                if before:
-                    raise
                 return alternative_repr(self, *args, **kwargs)  # noqa
             finally:
-                if not before:
-                    _in_repr = False
+                in_repr_var.reset(in_repr_token)
 
         return decorated
 
@@ -19,15 +19,26 @@ class SentinelMeta(type):
             _ = SentinelType
         except NameError:
             dct["__new__"] = staticmethod(_abstract_new)
+            abstract = True
         else:
             if bases != (SentinelType,):
                 error = "can only inherit directly from {!r}".format(
                     SentinelType.__name__
                 )
                 raise TypeError(error)
-            dct["__new__"] = staticmethod(_sentinel_new)
+            abstract = False
         cls = super(SentinelMeta, mcs).__new__(mcs, name, bases, dct, **kwargs)
-        cls.__instance__ = object.__new__(cast(Type["SentinelType"], cls))
+        instance = cls.__instance__ = object.__new__(cast(Type["SentinelType"], cls))
+
+        # Return the instance directly from the closure when 'instantiating'.
+        if not abstract:
+
+            def __new__(_cls, *args, **kwargs):  # noqa
+                # type: (Type[SentinelType], *Any, **Any) -> SentinelType
+                return instance
+
+            type.__setattr__(cls, "__new__", staticmethod(__new__))
+
         return cls
 
 
@@ -40,12 +51,6 @@ def _abstract_new(cls, *args, **kwargs):  # noqa
     raise NotImplementedError(error)
 
 
-def _sentinel_new(cls, *args, **kwargs):  # noqa
-    # type: (Type[SentinelType], *Any, **Any) -> SentinelType
-    assert cls.__instance__ is not None
-    return cls.__instance__
-
-
 class SentinelType(six.with_metaclass(SentinelMeta, object)):
     """Sentinel type."""
 
@@ -24,7 +24,7 @@ class SetNameMeta(type):
             # type: (...) -> _SNM
             cls = super(SetNameMeta, mcs).__new__(mcs, name, bases, dct, **kwargs)
             for member_name, member in six.iteritems(dct):
-                if hasattr(member, "__set_name__") and not isinstance(member, type):
+                if not isinstance(member, type) and hasattr(member, "__set_name__"):
                     member.__set_name__(cls, member_name)
             return cls
 
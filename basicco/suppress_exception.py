@@ -9,13 +9,11 @@ try:
     from contextlib import suppress as suppress_exception  # noqa
 
 except ImportError:
-    from contextlib import contextmanager
+    from types import TracebackType
 
-    from tippo import Any, Iterator, Type
+    from tippo import Tuple, Type, Union
 
-    @contextmanager
-    def _suppress_exception(*exceptions):
-        # type: (*Type[Exception]) -> Iterator[None]
+    class _SuppressException(object):
         """
         Return a context manager that suppresses any of the specified exceptions if they
         occur in the body of a with statement and then resumes execution with the first
@@ -24,15 +22,27 @@ except ImportError:
         As with any other mechanism that completely suppresses exceptions, this context
         manager should be used only to cover very specific errors where silently
         continuing with program execution is known to be the right thing to do.
-
-        :return: Null context manager.
         """
-        try:
-            yield
-        except Exception as e:
-            if not exceptions or not isinstance(e, exceptions):
-                raise
-
-    _suppress_exception.__name__ = "suppress_exception"
-    _suppress_exception.__qualname__ = "suppress_exception"
-    globals()["suppress_exception"] = _suppress_exception
+
+        __slots__ = ("_exceptions",)
+
+        def __init__(self, *exceptions):
+            # type: (*Type[BaseException]) -> None
+            self._exceptions = exceptions  # type: Tuple[Type[BaseException], ...]
+
+        def __enter__(self):
+            # type: () -> None
+            pass
+
+        def __exit__(
+            self,
+            exc_type,  # type: Union[Type[BaseException], None]
+            exc_value,  # type: Union[BaseException, None]
+            exc_tb,  # type: Union[TracebackType, None]
+        ):
+            # type: (...) -> bool
+            return exc_type is not None and issubclass(exc_type, self._exceptions)
+
+    type.__setattr__(_SuppressException, "__name__", "suppress_exception")
+    type.__setattr__(_SuppressException, "__qualname__", "suppress_exception")
+    globals()["suppress_exception"] = _SuppressException
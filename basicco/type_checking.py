@@ -1,14 +1,19 @@
 """Runtime type checking with support for import paths and type hints."""
 
-import itertools
+import operator
+import sys
 
 import six
 import typing_inspect  # type: ignore
+from six.moves import collections_abc
 from tippo import (
     Any,
     Callable,
+    Dict,
     ForwardRef,
+    FrozenSet,
     Iterable,
+    List,
     Mapping,
     Tuple,
     Type,
@@ -20,7 +25,8 @@ from tippo import (
     get_typing,
 )
 
-from basicco.import_path import get_name, import_path
+from basicco.func_tools import lru_cache
+from basicco.import_path import DEFAULT_BUILTIN_PATHS, get_name, import_path
 
 __all__ = [
     "TEXT_TYPES",
@@ -40,211 +46,441 @@ __all__ = [
 
 TEXT_TYPES = tuple({str, six.text_type})  # type: Tuple[Type[str], ...]
 
+_TEXT_TYPES_SET = frozenset(TEXT_TYPES)  # type: FrozenSet[Type[str]]
+_INTEGER_TYPES_SET = frozenset(six.integer_types)  # type: FrozenSet[Type[int]]
+_EXPAND_TEXT_TYPES = len(_TEXT_TYPES_SET) > 1
+_EXPAND_INTEGER_TYPES = len(_INTEGER_TYPES_SET) > 1
+
+if six.PY2:
+    _STRING_TYPES = six.string_types  # type: Union[Type[str], Tuple[Type[str], ...]]
+    _iterkeys = six.iterkeys
+    _itervalues = six.itervalues
+else:
+    _STRING_TYPES = str
+    _iterkeys = operator.methodcaller("keys")
+    _itervalues = operator.methodcaller("values")
+
 _T = TypeVar("_T")
+_NOTHING = object()
+
+# Plain classes as a tuple (for 'isinstance') and a frozenset (for membership tests).
+_PlainTypes = Tuple[Tuple[Type[Any], ...], FrozenSet[Type[Any]]]
+
+# Kinds of typing objects, used to dispatch typing checks.
+(
+    _ANY,
+    _LITERAL,
+    _UNION,
+    _TYPE,
+    _TUPLE,
+    _MAPPING,
+    _ITERABLE,
+    _FORWARD_REF,
+    _PLAIN,
+) = range(9)
 
 
 class TypeCheckError(Exception):
     """Raised when failed to assert type check."""
 
 
-def _check_literal(obj, literal, type_depth, *args):
-    # type: (Any, Any, int, *Any) -> bool
+class _CheckContext(object):
+    """Arguments that stay the same during a type check."""
+
+    __slots__ = ("subtypes", "extra_paths", "builtin_paths", "generic")
+
+    def __init__(
+        self,
+        subtypes,  # type: bool
+        extra_paths,  # type: Iterable[str]
+        builtin_paths,  # type: Union[Iterable[str], None]
+        generic,  # type: bool
+    ):
+        # type: (...) -> None
+        self.subtypes = subtypes
+        self.extra_paths = tuple(extra_paths)
+        self.builtin_paths = (
+            tuple(builtin_paths) if builtin_paths is not None else None
+        )  # type: Union[Tuple[str, ...], None]
+        self.generic = generic
+
+
+@lru_cache(maxsize=1024)
+def _locate_type_path(
+    path,  # type: str
+    extra_paths,  # type: Tuple[str, ...]
+    builtin_paths,  # type: Union[Tuple[str, ...], None]
+):
+    # type: (...) -> Union[Tuple[str, Tuple[str, ...]], None]
+
+    # Only simple dot paths can be located (generics are imported every time).
+    if "[" in path:
+        return None
+    obj = import_path(path, extra_paths=extra_paths, builtin_paths=builtin_paths)
+
+    # Find the module and attribute names the path resolved to (longest module path).
+    if builtin_paths is None:
+        builtin_paths = DEFAULT_BUILTIN_PATHS
+    for full_path in (path,) + tuple(
+        ".".join((p, path)) for p in extra_paths + builtin_paths
+    ):
+        path_parts = full_path.split(".")
+        for i in range(len(path_parts), 0, -1):
+            module_name = ".".join(path_parts[:i])
+            if sys.modules.get(module_name) is None:
+                continue
+            attribute_names = tuple(path_parts[i:])
+            if _resolve_type_path_location(module_name, attribute_names) is obj:
+                return module_name, attribute_names
+            break
+    return None
+
+
+def _resolve_type_path_location(module_name, attribute_names):
+    # type: (str, Tuple[str, ...]) -> Any
+    obj = sys.modules.get(module_name)  # type: Any
+    if obj is None:
+        return _NOTHING
+    for attribute_name in attribute_names:
+        obj = getattr(obj, attribute_name, _NOTHING)
+        if obj is _NOTHING:
+            break
+    return obj
+
+
+def _import_type_path(
+    path,  # type: str
+    extra_paths,  # type: Tuple[str, ...]
+    builtin_paths,  # type: Union[Tuple[str, ...], None]
+    generic,  # type: bool
+):
+    # type: (...) -> Any
+
+    # Only the location is cached, the object is always looked up in the module again
+    # (so reloaded modules and patched attributes are respected).
+    location = _locate_type_path(path, extra_paths, builtin_paths)
+    if location is not None:
+        obj = _resolve_type_path_location(*location)
+        if obj is not _NOTHING:
+            return obj
+    return import_path(
+        path, extra_paths=extra_paths, builtin_paths=builtin_paths, generic=generic
+    )
+
+
+def _is_named(typ):
+    # type: (Any) -> bool
+    return get_name(typ) is not None
+
+
+# Only caches whether there's a name, since equal objects can have different names
+# (like 'int | str' and 'Union[int, str]').
+_is_cached_named = lru_cache(maxsize=1024)(_is_named)
+
+
+def _has_name(typ):
+    # type: (Any) -> bool
+    try:
+        return _is_cached_named(typ)
+    except TypeError:  # not hashable
+        return _is_named(typ)
+
+
+def _accepts_anything(typ):
+    # type: (Any) -> bool
+    return typ is Any or typ is object
+
+
+def _is_plain_type(typ, typing):
+    # type: (Any, bool) -> bool
+    if not isinstance(typ, type):
+        return False
+    if _EXPAND_TEXT_TYPES and typ in _TEXT_TYPES_SET:
+        return False
+    if _EXPAND_INTEGER_TYPES and typ in _INTEGER_TYPES_SET:
+        return False
+    return not typing or _get_typing_kind(typ) == _PLAIN
+
+
+def _check_values(values, typ, type_depth, instance, typing, ctx):
+    # type: (Iterable[Any], Any, int, Any, bool, _CheckContext) -> bool
+
+    # Values can be anything.
+    if _accepts_anything(typ):
+        return True
+
+    # Check plain classes directly instead of going through '_check' for each value.
+    if _is_plain_type(typ, typing):
+        if ctx.subtypes:
+            for value in values:
+                if not isinstance(value, typ):
+                    return False
+        else:
+            for value in values:
+                if type(value) is not typ:
+                    return False
+        return True
+
+    for value in values:
+        if not _check(value, typ, type_depth, instance, typing, ctx):
+            return False
+    return True
+
+
+def _check_literal(obj, literal, origin, type_args, type_depth, instance, typing, ctx):
+    # type: (Any, Any, Any, Tuple[Any, ...], int, Any, bool, _CheckContext) -> bool
     return any(
-        _check(obj, type(v), type_depth, *args) if type_depth else obj == v
-        for v in get_args(literal)
+        (
+            _check(obj, type(v), type_depth, instance, typing, ctx)
+            if type_depth
+            else obj == v
+        )
+        for v in type_args
     )
 
 
-def _check_union(obj, union, *args):
-    # type: (Any, Any, *Any) -> bool
-    return any(_check(obj, t, *args) for t in get_args(union))
+def _find_plain_types(types):
+    # type: (Tuple[Any, ...]) -> Union[_PlainTypes, None]
+    if all(t is not object and _is_plain_type(t, True) for t in types):
+        return types, frozenset(types)
+    return None
 
 
-def _check_type(obj, typ, type_depth, *args):
-    # type: (Any, Any, int, *Any) -> bool
+_find_cached_plain_types = lru_cache(maxsize=1024)(_find_plain_types)
+
+
+def _get_plain_types(types):
+    # type: (Tuple[Any, ...]) -> Union[_PlainTypes, None]
+    try:
+        return _find_cached_plain_types(types)
+    except TypeError:  # not hashable
+        return None
+
+
+def _check_union(obj, union, origin, type_args, type_depth, instance, typing, ctx):
+    # type: (Any, Any, Any, Tuple[Any, ...], int, Any, bool, _CheckContext) -> bool
+
+    # Union of plain classes (like 'Optional[int]') can be checked all at once.
+    if instance and not type_depth:
+        plain_types = _get_plain_types(type_args)
+        if plain_types is not None:
+            if ctx.subtypes:
+                return isinstance(obj, plain_types[0])
+            else:
+                return type(obj) in plain_types[1]
+
+    return any(_check(obj, t, type_depth, instance, typing, ctx) for t in type_args)
+
+
+def _check_type(obj, typ, origin, type_args, type_depth, instance, typing, ctx):
+    # type: (Any, Any, Any, Tuple[Any, ...], int, Any, bool, _CheckContext) -> bool
     if not isinstance(obj, type):
         return False
 
-    type_args = get_args(typ)
     if not type_args:
         return True
 
     assert len(type_args) == 1
     value_type = type_args[0]
+
+    # Any class is accepted by 'Type[Any]' (and by a top-level 'Type[object]').
+    if value_type is Any or (value_type is object and instance and not type_depth):
+        return True
+
     type_depth += 1
 
-    return _check(obj, value_type, type_depth, *args)
+    return _check(obj, value_type, type_depth, instance, typing, ctx)
 
 
-def _check_tuple(obj, typed_tuple, type_depth, instance, *args):
-    # type: (Any, Any, int, Any, *Any) -> bool
+def _check_tuple(
+    obj, typed_tuple, origin, type_args, type_depth, instance, typing, ctx
+):
+    # type: (Any, Any, Any, Tuple[Any, ...], int, Any, bool, _CheckContext) -> bool
     if type_depth or not instance:
-        return _check(obj, tuple, type_depth, instance, *args)
+        return _check(obj, tuple, type_depth, instance, typing, ctx)
 
     if not isinstance(obj, tuple):
         return False
 
-    tuple_args = get_args(typed_tuple)
-    if not tuple_args:
+    if not type_args:
         return True
 
-    if tuple_args[-1] == Ellipsis:
-        if len(tuple_args) == 1:
+    if type_args[-1] == Ellipsis:
+        if len(type_args) == 1:
             return True
-        typ = tuple_args[0]
-        return all(_check(v, typ, type_depth, instance, *args) for v in obj)
+        typ = type_args[0]
+        return _check_values(obj, typ, type_depth, instance, typing, ctx)
 
-    if len(obj) != len(tuple_args):
+    if len(obj) != len(type_args):
         return False
 
+    # Check plain classes directly instead of going through '_check' for each value.
+    if _get_plain_types(type_args) is not None:
+        if ctx.subtypes:
+            for value, typ in zip(obj, type_args):
+                if not isinstance(value, typ):
+                    return False
+        else:
+            for value, typ in zip(obj, type_args):
+                if type(value) is not typ:
+                    return False
+        return True
+
     return all(
-        _check(v, t, type_depth, instance, *args) for v, t in zip(obj, tuple_args)
+        _check(v, t, type_depth, instance, typing, ctx) for v, t in zip(obj, type_args)
     )
 
 
-def _check_mapping(obj, mapping, type_depth, instance, typing, *args):
-    # type: (Any, Any, int, Any, bool, *Any) -> bool
-    origin = cast("Type[Mapping[Any, Any]]", get_origin(mapping))
+def _check_mapping(
+    obj,  # type: Any
+    mapping,  # type: Any
+    origin,  # type: Type[Mapping[Any, Any]]
+    type_args,  # type: Tuple[Any, ...]
+    type_depth,  # type: int
+    instance,  # type: Any
+    typing,  # type: bool
+    ctx,  # type: _CheckContext
+):
+    # type: (...) -> bool
     if type_depth or not instance:
-        return _check(obj, origin, type_depth, instance, False, *args)
+        return _check(obj, origin, type_depth, instance, False, ctx)
 
     if not isinstance(obj, origin):
         return False
 
-    mapping_args = get_args(mapping)
-    if not mapping_args:
+    if not type_args:
         return True
 
-    assert len(mapping_args) == 2
-    key_type, value_type = mapping_args
-    for key, value in six.iteritems(obj):
-        if not _check(key, key_type, type_depth, instance, typing, *args):
-            return False
-        if not _check(value, value_type, type_depth, instance, typing, *args):
-            return False
+    assert len(type_args) == 2
+    key_type, value_type = type_args
 
-    return True
+    if not _check_values(_iterkeys(obj), key_type, type_depth, instance, typing, ctx):
+        return False
+    return _check_values(
+        _itervalues(obj), value_type, type_depth, instance, typing, ctx
+    )
 
 
-def _check_iterable(obj, iterable, type_depth, instance, typing, *args):
-    # type: (Any, Any, int, Any, bool, *Any) -> bool
-    origin = cast("Type[Iterable[Any]]", get_origin(iterable))
+def _check_iterable(
+    obj,  # type: Any
+    iterable,  # type: Any
+    origin,  # type: Type[Iterable[Any]]
+    type_args,  # type: Tuple[Any, ...]
+    type_depth,  # type: int
+    instance,  # type: Any
+    typing,  # type: bool
+    ctx,  # type: _CheckContext
+):
+    # type: (...) -> bool
     if type_depth or not instance:
-        return _check(obj, origin, type_depth, instance, False, *args)
+        return _check(obj, origin, type_depth, instance, False, ctx)
 
     if not isinstance(obj, origin):
         return False
 
-    iterable_args = get_args(iterable)
-    if not iterable_args:
+    if not type_args:
         return True
 
-    assert len(iterable_args) == 1
-    value_type = iterable_args[0]
-    for value in obj:
-        if not _check(value, value_type, type_depth, instance, typing, *args):
-            return False
-
-    return True
+    assert len(type_args) == 1
+    value_type = type_args[0]
+    return _check_values(obj, value_type, type_depth, instance, typing, ctx)
 
 
 def _check_forward_ref(
     obj,  # type: Any
     forward_ref,  # type: Any
+    origin,  # type: Any
+    type_args,  # type: Tuple[Any, ...]
     type_depth,  # type: int
     instance,  # type: Any
     typing,  # type: bool
-    subtypes,  # type: bool
-    extra_paths,  # type: Iterable[str]
-    builtin_paths,  # type: Union[Iterable[str], None]
-    generic,  # type: bool
+    ctx,  # type: _CheckContext
 ):
     # type: (...) -> bool
-    typ = import_path(
-        forward_ref.__forward_arg__,
-        extra_paths=extra_paths,
-        builtin_paths=builtin_paths,
-        generic=generic,
-    )
-    return _check(
-        obj,
-        typ,
-        type_depth,
-        instance,
-        typing,
-        subtypes,
-        extra_paths,
-        builtin_paths,
-        generic,
+    typ = _import_type_path(
+        forward_ref.__forward_arg__, ctx.extra_paths, ctx.builtin_paths, ctx.generic
     )
+    return _check(obj, typ, type_depth, instance, typing, ctx)
 
 
-def _check_typing(
-    obj,  # type: Any
-    typ,  # type: Any
-    type_depth,  # type: int
-    instance,  # type: Any
-    typing,  # type: bool
-    subtypes,  # type: bool
-    extra_paths,  # type: Iterable[str]
-    builtin_paths,  # type: Union[Iterable[str], None]
-    generic,  # type: bool
-):
-    # type: (...) -> bool
-    args = (
-        type_depth,
-        instance,
-        typing,
-        subtypes,
-        extra_paths,
-        builtin_paths,
-        generic,
-    )
+def _classify_typing(typ):
+    # type: (Any) -> int
 
     # Any.
     if typ is Any:
-        return True
+        return _ANY
 
     # Literal.
     if typing_inspect.is_literal_type(typ):
-        return _check_literal(obj, typ, *args)
+        return _LITERAL
 
     # Union.
     if typing_inspect.is_union_type(typ):
-        return _check_union(obj, typ, *args)
+        return _UNION
 
     # Type.
-    if get_typing(get_origin(typ)) is Type:
-        return _check_type(obj, typ, *args)
+    origin = get_origin(typ)
+    if origin is not None and get_typing(origin) is Type:
+        return _TYPE
 
     # Tuple.
     if typing_inspect.is_tuple_type(typ):
-        return _check_tuple(obj, typ, *args)
+        return _TUPLE
 
-    # Mapping.
-    try:
-        type_is_mapping = issubclass(cast(type, get_typing(get_origin(typ))), Mapping)
-    except TypeError:
-        pass
-    else:
-        if type_is_mapping:
-            return _check_mapping(obj, typ, *args)
-
-    # Iterable.
-    try:
-        type_is_iterable = issubclass(cast(type, get_typing(get_origin(typ))), Iterable)
-    except TypeError:
-        pass
-    else:
-        if type_is_iterable:
-            return _check_iterable(obj, typ, *args)
+    # Mapping/Iterable (only classes can be subclass-checked).
+    if isinstance(origin, type):
+        if issubclass(origin, Mapping):
+            return _MAPPING
+        if issubclass(origin, Iterable):
+            return _ITERABLE
 
     # Forward reference.
     if isinstance(typ, ForwardRef):
-        return _check_forward_ref(obj, typ, *args)
+        return _FORWARD_REF
+
+    # Not typing.
+    return _PLAIN
+
+
+# Only the kind is cached, since equal objects can have different arguments (like
+# unions with the same arguments in a different order).
+_classify_cached_typing = lru_cache(maxsize=1024)(_classify_typing)
+
+
+def _get_typing_kind(typ):
+    # type: (Any) -> int
+    try:
+        return _classify_cached_typing(typ)
+    except TypeError:  # not hashable
+        return _classify_typing(typ)
+
+
+def _check_typing(obj, typ, type_depth, instance, typing, ctx):
+    # type: (Any, Any, int, Any, bool, _CheckContext) -> bool
+    kind = _get_typing_kind(typ)
+
+    # Any.
+    if kind == _ANY:
+        return True
 
     # Not typing.
-    return _check(obj, typ, args[0], args[1], False, *args[3:])
+    if kind == _PLAIN:
+        return _check(obj, typ, type_depth, instance, False, ctx)
+
+    return _TYPING_CHECKS[kind](
+        obj, typ, get_origin(typ), get_args(typ), type_depth, instance, typing, ctx
+    )
+
+
+_TYPING_CHECKS = {
+    _LITERAL: _check_literal,
+    _UNION: _check_union,
+    _TYPE: _check_type,
+    _TUPLE: _check_tuple,
+    _MAPPING: _check_mapping,
+    _ITERABLE: _check_iterable,
+    _FORWARD_REF: _check_forward_ref,
+}  # type: Dict[int, Callable[..., bool]]
 
 
 def _check(
@@ -253,84 +489,54 @@ def _check(
     type_depth,  # type: int
     instance,  # type: Any
     typing,  # type: bool
-    subtypes,  # type: bool
-    extra_paths,  # type: Iterable[str]
-    builtin_paths,  # type: Union[Iterable[str], None]
-    generic,  # type: bool
+    ctx,  # type: _CheckContext
     _expand_py2_types=True,  # type: bool
 ):
     # type: (...) -> bool
 
     # Import lazy path.
-    if isinstance(typ, six.string_types):
-        typ = import_path(
-            typ,
-            extra_paths=extra_paths,
-            builtin_paths=builtin_paths,
-            generic=generic,
-        )
+    if isinstance(typ, _STRING_TYPES):
+        typ = _import_type_path(typ, ctx.extra_paths, ctx.builtin_paths, ctx.generic)
 
     # Expand python 2 types.
     if _expand_py2_types:
         # Check against all text types.
-        if len(TEXT_TYPES) > 1:
-            text_types = set(TEXT_TYPES)
-            if text_types.intersection({typ}):
-                return any(
-                    _check(
-                        obj,
-                        t,
-                        type_depth,
-                        instance,
-                        typing,
-                        subtypes,
-                        extra_paths,
-                        builtin_paths,
-                        generic,
-                        _expand_py2_types=False,
-                    )
-                    for t in text_types
+        if _EXPAND_TEXT_TYPES and typ in _TEXT_TYPES_SET:
+            return any(
+                _check(
+                    obj, t, type_depth, instance, typing, ctx, _expand_py2_types=False
                 )
+                for t in _TEXT_TYPES_SET
+            )
 
         # Check against all integer types.
-        if len(six.integer_types) > 1:
-            integer_types = set(six.integer_types)
-            if integer_types.intersection({typ}):
-                return any(
-                    _check(
-                        obj,
-                        t,
-                        type_depth,
-                        instance,
-                        typing,
-                        subtypes,
-                        extra_paths,
-                        builtin_paths,
-                        generic,
-                        _expand_py2_types=False,
-                    )
-                    for t in integer_types
+        if _EXPAND_INTEGER_TYPES and typ in _INTEGER_TYPES_SET:
+            return any(
+                _check(
+                    obj, t, type_depth, instance, typing, ctx, _expand_py2_types=False
                 )
+                for t in _INTEGER_TYPES_SET
+            )
 
     # Convert None to NoneType.
     if typ is None:
         typ = type(None)
 
+    # Plain classes don't need typing checks (classification is cached).
+    if typing and isinstance(typ, type) and _get_typing_kind(typ) == _PLAIN:
+        typing = False
+
+    # Fast path for plain classes when not checking typing or type depth.
+    if not typing and not type_depth and isinstance(typ, type) and typ is not object:
+        if instance:
+            return isinstance(obj, typ) if ctx.subtypes else type(obj) is typ
+        elif isinstance(obj, type):
+            return issubclass(obj, typ) if ctx.subtypes else obj is typ
+
     # Typing check.
     if typing:
-        typing_name = get_name(typ)
-        if typing_name is not None:
-            return _check_typing(
-                obj,
-                typ,
-                type_depth,
-                instance,
-                typing,
-                subtypes,
-                extra_paths,
-                builtin_paths,
-                generic,
-            )
+        if _has_name(typ):
+            return _check_typing(obj, typ, type_depth, instance, typing, ctx)
 
     # Invalid type.
     if not isinstance(typ, type) and not hasattr(typ, "__subclasscheck__"):
@@ -353,7 +559,7 @@ def _check(
 
     # Instance checks.
     if instance:
-        if subtypes:
+        if ctx.subtypes:
             return isinstance(obj, typ)
         else:
             return type(obj) is typ
@@ -362,12 +568,50 @@ def _check(
     elif not isinstance(obj, type):
         error = "{!r} object is not a class".format(type(obj).__name__)
         raise TypeError(error)
-    elif subtypes:
+    elif ctx.subtypes:
         return issubclass(obj, typ)
     else:
         return obj is typ
 
 
+def _is_plain_tuple(types, paths):
+    # type: (Any, bool) -> bool
+    if not isinstance(types, tuple):
+        return False
+    for typ in types:
+        if typ is None or isinstance(typ, type):
+            continue
+        if paths and isinstance(typ, _STRING_TYPES):
+            continue
+        return False
+    return True
+
+
+def _format_types(types):
+    # type: (Any) -> Tuple[Any, ...]
+    formatted_types = []  # type: List[Any]
+    stack = [types]
+    while stack:
+        typ = stack.pop()
+        if typ is None:
+            formatted_types.append(type(None))
+        elif isinstance(typ, type) or isinstance(typ, _STRING_TYPES):
+            formatted_types.append(typ)
+        elif typing_inspect.is_union_type(typ):
+            stack.extend(reversed(get_args(typ)))
+        elif _has_name(typ):
+            formatted_types.append(typ)
+        elif isinstance(typ, Iterable):
+            stack.extend(reversed(tuple(typ)))
+        else:
+            error = "{!r} object is not a valid type".format(type(typ).__name__)
+            raise TypeError(error)
+    return tuple(formatted_types)
+
+
+_format_cached_types = lru_cache(maxsize=1024)(_format_types)
+
+
 def format_types(
     types,  # type: Union[Type[_T], str, None, Iterable[Union[Type[_T], str, None]]]
 ):
@@ -380,21 +624,32 @@ def format_types(
     """
     if types is None:
         return (type(None),)
-    elif typing_inspect.is_union_type(types):
-        return tuple(
-            itertools.chain.from_iterable(format_types(t) for t in get_args(types))
-        )
-    elif (
-        isinstance(types, type)
-        or isinstance(types, six.string_types)
-        or get_name(types) is not None
-    ):
-        return (types,)  # type: ignore
-    elif isinstance(types, Iterable):
-        return tuple(itertools.chain.from_iterable(format_types(t) for t in types))
-    else:
-        error = "{!r} object is not a valid type".format(type(types).__name__)
-        raise TypeError(error)
+    elif isinstance(types, type) or isinstance(types, _STRING_TYPES):
+        return (types,)
+
+    # Cache results for tuples of classes/paths only (typing objects like unions can
+    # compare equal regardless of the order of their arguments).
+    if _is_plain_tuple(types, True):
+        try:
+            return _format_cached_types(types)  # type: ignore
+        except TypeError:  # not hashable
+            pass
+    return _format_types(types)
+
+
+def _type_names(formatted_types):
+    # type: (Tuple[Any, ...]) -> Tuple[str, ...]
+    type_names_ = []
+    for typ in formatted_types:
+        if isinstance(typ, _STRING_TYPES):
+            type_names_.append(typ.rpartition(".")[2])
+        elif isinstance(typ, type):
+            type_names_.append(typ.__name__)
+        elif get_name(typ) is not None:
+            type_names_.append(repr(typ))
+        else:
+            type_names_.append(type(typ).__name__)
+    return tuple(type_names_)
 
 
 def type_names(
@@ -407,17 +662,40 @@ def type_names(
     :param types: Types.
     :return: Type names.
     """
-    type_names_ = []
+    return _type_names(format_types(types))
+
+
+def _import_types(
+    types,  # type: Any
+    extra_paths,  # type: Tuple[str, ...]
+    builtin_paths,  # type: Union[Tuple[str, ...], None]
+    generic,  # type: bool
+):
+    # type: (...) -> Tuple[Any, ...]
+    imported_types = []  # type: List[Any]
     for typ in format_types(types):
-        if isinstance(typ, six.string_types):
-            type_names_.append(typ.split(".")[-1])
-        elif isinstance(typ, type):
-            type_names_.append(typ.__name__)
-        elif get_name(typ) is not None:
-            type_names_.append(repr(typ))
+        if isinstance(typ, _STRING_TYPES):
+            # Imported objects might need formatting (None, unions, etc).
+            imported_types.extend(
+                format_types(
+                    _import_type_path(typ, extra_paths, builtin_paths, generic)
+                )
+            )
         else:
-            type_names_.append(type(typ).__name__)
-    return tuple(type_names_)
+            imported_types.append(typ)
+
+    # Expand all text types.
+    if _EXPAND_TEXT_TYPES and _TEXT_TYPES_SET.intersection(imported_types):
+        imported_types.extend(_TEXT_TYPES_SET.difference(imported_types))
+
+    # Expand all integer types.
+    if _EXPAND_INTEGER_TYPES and _INTEGER_TYPES_SET.intersection(imported_types):
+        imported_types.extend(_INTEGER_TYPES_SET.difference(imported_types))
+
+    return tuple(imported_types)
+
+
+_import_cached_types = lru_cache(maxsize=1024)(_import_types)
 
 
 def import_types(
@@ -436,30 +714,23 @@ def import_types(
     :param generic: Whether to import generic.
     :return: Imported types.
     """
-    imported_types = tuple(
-        (
-            import_path(
-                t, extra_paths=extra_paths, builtin_paths=builtin_paths, generic=generic
+    extra_paths = tuple(extra_paths)
+    if builtin_paths is not None:
+        builtin_paths = tuple(builtin_paths)
+
+    # Cache results for tuples of classes only (typing objects like unions can compare
+    # equal regardless of the order of their arguments, and paths can be re-imported).
+    if _is_plain_tuple(types, False):
+        try:
+            return _import_cached_types(
+                types,  # type: ignore
+                extra_paths,
+                builtin_paths,
+                generic,
             )
-            if isinstance(t, six.string_types)
-            else t
-        )
-        for t in format_types(types)
-    )
-
-    # Expand all text types.
-    if len(TEXT_TYPES) > 1:
-        text_types = set(TEXT_TYPES)
-        if text_types.intersection(imported_types):
-            imported_types += tuple(text_types.difference(imported_types))
-
-    # Expand all integer types.
-    if len(six.integer_types) > 1:
-        integer_types = set(six.integer_types)
-        if integer_types.intersection(imported_types):
-            imported_types += tuple(integer_types.difference(imported_types))
-
-    return cast(Tuple[Type[_T], ...], format_types(imported_types))
+        except TypeError:  # not hashable
+            pass
+    return _import_types(types, extra_paths, builtin_paths, generic)
 
 
 def is_instance(
@@ -484,24 +755,36 @@ def is_instance(
     :param typing: Whether to check against typing.
     :return: True if it is an instance.
     """
+
+    # Single plain class, check against it directly.
+    if (
+        isinstance(types, type)
+        and types is not object
+        and _is_plain_type(types, typing)
+    ):
+        return isinstance(obj, types) if subtypes else type(obj) is types
+
+    ctx = _CheckContext(subtypes, extra_paths, builtin_paths, generic)
     imported_types = import_types(
-        types, extra_paths=extra_paths, builtin_paths=builtin_paths, generic=generic
-    )
-    return any(
-        _check(
-            obj=obj,
-            typ=t,
-            type_depth=0,
-            instance=True,
-            typing=typing,
-            subtypes=subtypes,
-            extra_paths=extra_paths,
-            builtin_paths=builtin_paths,
-            generic=generic,
-        )
-        for t in imported_types
+        types,
+        extra_paths=ctx.extra_paths,
+        builtin_paths=ctx.builtin_paths,
+        generic=generic,
     )
 
+    # Only plain classes, check against all of them at once.
+    plain_types = _get_plain_types(imported_types)
+    if plain_types is not None:
+        if subtypes:
+            return isinstance(obj, plain_types[0])
+        else:
+            return type(obj) in plain_types[1]
+
+    for typ in imported_types:
+        if _check(obj, typ, 0, True, typing, ctx):
+            return True
+    return False
+
 
 def is_subclass(
     cls,  # type: Type[Any]
@@ -529,24 +812,33 @@ def is_subclass(
     if not isinstance(cls, type):
         error = "is_subclass() arg 1 must be a class"
         raise TypeError(error)
+
+    # Single plain class, check against it directly.
+    if (
+        isinstance(types, type)
+        and types is not object
+        and _is_plain_type(types, typing)
+    ):
+        return issubclass(cls, types) if subtypes else cls is types
+
+    ctx = _CheckContext(subtypes, extra_paths, builtin_paths, generic)
     imported_types = import_types(
-        types, extra_paths=extra_paths, builtin_paths=builtin_paths, generic=generic
-    )
-    return any(
-        _check(
-            obj=cls,
-            typ=t,
-            type_depth=0,
-            instance=False,
-            typing=typing,
-            subtypes=subtypes,
-            extra_paths=extra_paths,
-            builtin_paths=builtin_paths,
-            generic=generic,
-        )
-        for t in imported_types
+        types,
+        extra_paths=ctx.extra_paths,
+        builtin_paths=ctx.builtin_paths,
+        generic=generic,
     )
 
+    # Only plain classes, check against all of them at once.
+    plain_types = _get_plain_types(imported_types)
+    if plain_types is not None:
+        return issubclass(cls, plain_types[0]) if subtypes else cls in plain_types[1]
+
+    for typ in imported_types:
+        if _check(cls, typ, 0, False, typing, ctx):
+            return True
+    return False
+
 
 def is_iterable(value, include_strings=False):
     # type: (Any, bool) -> bool
@@ -558,8 +850,8 @@ def is_iterable(value, include_strings=False):
     :param include_strings: Whether to consider strings as iterables.
     :return: True if iterable.
     """
-    return isinstance(value, Iterable) and (
-        (not isinstance(value, six.string_types) or include_strings)
+    return isinstance(value, collections_abc.Iterable) and (
+        (not isinstance(value, _STRING_TYPES) or include_strings)
     )
 
 
@@ -601,7 +893,7 @@ def assert_is_instance(
             raise ValueError(error)
         error = "got {!r} object, expected instance of {}{}".format(
             type(obj).__name__,
-            ", ".join(repr(n) for n in type_names(formatted_types)),
+            ", ".join(repr(n) for n in _type_names(formatted_types)),
             "" if subtypes else " (instances of subclasses are not accepted)",
         )
         raise TypeCheckError(error)
@@ -636,7 +928,7 @@ def assert_is_subclass(
         error = "got instance of {!r}, expected {}{}{}".format(
             type(cls).__name__,
             "one of " if len(formatted_types) > 1 else "class ",
-            ", ".join(repr(n) for n in type_names(formatted_types)),
+            ", ".join(repr(n) for n in _type_names(formatted_types)),
             "" if subtypes else " (subclasses are not accepted)",
         )
         raise TypeCheckError(error)
@@ -658,7 +950,7 @@ def assert_is_subclass(
         error = "got {!r}, expected {}{}{}".format(
             cls.__name__,
             "one of " if len(formatted_types) > 1 else "class ",
-            ", ".join(repr(n) for n in type_names(formatted_types)),
+            ", ".join(repr(n) for n in _type_names(formatted_types)),
             "" if subtypes else " (subclasses are not accepted)",
         )
         raise TypeCheckError(error)
@@ -62,6 +62,16 @@ def test_get_slotted_state():
     assert get_state(SubClass()) == {"a": 1, "b": 2, "c": 3}
 
 
+def test_get_single_slot_state():
+    class Class(object):
+        __slots__ = "abc"
+
+        def __init__(self):
+            self.abc = 1
+
+    assert get_state(Class()) == {"abc": 1}
+
+
 def test_get_protected_slotted_state():
     class Class(object):
         __slots__ = ("__a", "__b")
@@ -160,6 +170,48 @@ def test_reducer():
     assert pickled_obj.d == 4
 
 
+def test_reducer_paths():
+    class LocalClass(object):
+        __slots__ = ("a",)
+
+    obj = _Class()
+    obj.a = 1
+    local_obj = LocalClass()
+    local_obj.a = 2
+
+    # Importable classes are reduced to their path, local ones to the class itself.
+    for _ in range(2):
+        func, (cls_or_path, state) = reducer(obj)
+        assert cls_or_path == "{}._Class".format(__name__)
+        assert func(cls_or_path, state).a == 1
+
+        func, (cls_or_path, state) = reducer(local_obj)
+        assert cls_or_path is LocalClass
+        assert func(cls_or_path, state).a == 2
+
+
+def test_reducer_rebound_path():
+    obj = _Class()
+    obj.a = 1
+    func, (cls_or_path, state) = reducer(obj)
+    assert cls_or_path == "{}._Class".format(__name__)
+
+    # Rebound module attribute, the path no longer leads to the class.
+    class Other(object):
+        __slots__ = ("a",)
+
+    globals()["_Class"] = Other
+    try:
+        func, (cls_or_path, state) = reducer(obj)
+        assert cls_or_path is type(obj)
+        assert type(func(cls_or_path, state)) is type(obj)
+    finally:
+        globals()["_Class"] = type(obj)
+
+    func, (cls_or_path, state) = reducer(obj)
+    assert cls_or_path == "{}._Class".format(__name__)
+
+
 def test_reducible_class():
     assert isinstance(Reducible, ReducibleMeta)
 
@@ -13,5 +13,25 @@ def test_recursive_repr():
     assert my_repr(object()) == "MyRepr<...>"  # noqa
 
 
+def test_max_depth():
+    @recursive_repr(max_depth=2, max_repr="!")
+    def my_repr(_self):
+        return "<" + my_repr(_self) + ">"
+
+    assert my_repr(object()) == "<<!>>"
+
+    depths = []
+
+    @recursive_repr(max_depth=None)
+    def my_unbounded_repr(_self, depth=0):
+        depths.append(depth)
+        if depth < 3:
+            return "<" + my_unbounded_repr(_self, depth + 1) + ">"
+        return "..."
+
+    assert my_unbounded_repr(object()) == "<<<...>>>"
+    assert depths == [0, 1, 2, 3]
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -83,6 +83,93 @@ def test_final_method():
             assert not SubClass
 
 
+def test_final_method_set_attr():
+    class Class(six.with_metaclass(RuntimeFinalMeta, object)):
+        @final
+        def method(self):
+            pass
+
+    class SubClass(Class):
+        pass
+
+    # Setting a final member on a subclass should not override the base's.
+    with pytest.raises(TypeError):
+        SubClass.method = final(lambda _: None)
+
+    SubClass.new_method = final(lambda _: None)
+    assert getattr(SubClass, _FINAL_METHODS) == {"method", "new_method"}
+    assert getattr(Class, _FINAL_METHODS) == {"method"}
+
+    del SubClass.new_method
+    assert getattr(SubClass, _FINAL_METHODS) == {"method"}
+
+
+def test_final_method_set_attr_on_base():
+    class Class(RuntimeFinal):
+        pass
+
+    class SubClass(Class):
+        pass
+
+    # Final member added to the base after the subclass was created.
+    Class.method = final(lambda _: None)
+    with pytest.raises(TypeError):
+        SubClass.method = final(lambda _: None)
+
+    # Deleting the subclass' own member keeps the base's final member.
+    type.__setattr__(SubClass, "method", final(lambda _: None))
+    del SubClass.method
+    assert "method" in getattr(SubClass, _FINAL_METHODS)
+
+
+def test_final_method_set_attr_before_init():
+    class Meta(RuntimeFinalMeta):
+        def __new__(mcs, name, bases, dct, **kwargs):
+            cls = super(Meta, mcs).__new__(mcs, name, bases, dct, **kwargs)
+            if name in ("Class", "SubClass"):
+                cls.method = final(lambda _: None)
+            return cls
+
+    # Setting a final member before the metaclass initializes the class.
+    class Class(six.with_metaclass(Meta, object)):
+        pass
+
+    assert getattr(Class, _FINAL_METHODS) == {"method"}
+
+    with pytest.raises(TypeError):
+
+        class SubClass(Class):
+            pass
+
+        assert not SubClass
+
+
+def test_final_method_mixin():
+    class Mixin(object):
+        @final
+        def method(self):
+            pass
+
+    class Class(six.with_metaclass(RuntimeFinalMeta, object)):
+        pass
+
+    assert getattr(Class, _FINAL_METHODS) == set()
+
+    # Final members from bases that don't use the metaclass are also considered.
+    class SubClass(Class, Mixin):
+        pass
+
+    assert getattr(SubClass, _FINAL_METHODS) == {"method"}
+
+    with pytest.raises(TypeError):
+
+        class SubSubClass(SubClass):
+            def method(self):
+                pass
+
+        assert not SubSubClass
+
+
 def test_descriptor():
     class Descriptor(object):
         def __init__(self, func):
@@ -18,5 +18,30 @@ def test_safe_repr():
     )
 
 
+def test_nested_safe_repr():
+    class Inner(object):
+        @safe_repr
+        def __repr__(self):
+            raise RuntimeError("inner")
+
+    class Outer(object):
+        def __init__(self):
+            self.inner = Inner()
+
+        @safe_repr
+        def __repr__(self):
+            return "Outer({!r})".format(self.inner)
+
+    # Failures of nested safe reprs propagate to the outermost one.
+    obj = Outer()
+    standard_repr = object.__repr__(obj)
+    assert (
+        repr(obj) == standard_repr[:-1] + "; repr failed due to 'RuntimeError: inner'>"
+    )
+
+    # Not nested, handled by itself.
+    assert repr(obj.inner).endswith("; repr failed due to 'RuntimeError: inner'>")
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -2,6 +2,7 @@
 
 import abc
 import itertools
+import sys
 
 import pytest
 import six
@@ -63,6 +64,12 @@ def test_type_names():
         "chain",
     )
 
+    # Unions compare equal regardless of order, but names should keep their order.
+    assert type_names(tippo.Union[int, str]) == ("int", "str")
+    assert type_names(tippo.Union[str, int]) == ("str", "int")
+    assert type_names(tippo.Optional[int]) == ("int", "NoneType")
+    assert type_names(tippo.Union[None, int]) == ("NoneType", "int")
+
 
 def test_import_types():
     assert import_types(None) == (type(None),)
@@ -73,6 +80,10 @@ def test_import_types():
         itertools.chain,
     )
 
+    # Unions compare equal regardless of order, but imported types keep their order.
+    assert import_types(tippo.Union[int, str]) == (int, str)
+    assert import_types(tippo.Union[str, int]) == (str, int)
+
 
 def test_is_instance():
     assert is_instance(None, None)
@@ -113,6 +124,33 @@ def test_is_instance():
     assert is_instance(SubCls(), ()) is False
 
 
+def test_is_instance_no_typing():
+    assert is_instance(Cls(), Cls, typing=False) is True
+    assert is_instance(SubCls(), Cls, typing=False) is True
+    assert is_instance(SubCls(), Cls, subtypes=False, typing=False) is False
+    assert is_instance(Cls(), object, subtypes=False, typing=False) is True
+    assert is_subclass(SubCls, Cls, typing=False) is True
+    assert is_subclass(SubCls, Cls, subtypes=False, typing=False) is False
+    assert is_subclass(Cls, object, subtypes=False, typing=False) is True
+
+
+def test_is_instance_patched_path():
+    child_cls = Parent.Child
+    assert is_instance(child_cls(), nested_cls_path) is True
+
+    # Lazy paths should resolve to the current object, not a previously imported one.
+    class Child(object):
+        pass
+
+    Parent.Child = Child
+    try:
+        assert is_instance(Child(), nested_cls_path) is True
+        assert is_instance(child_cls(), nested_cls_path) is False
+    finally:
+        Parent.Child = child_cls
+    assert is_instance(child_cls(), nested_cls_path) is True
+
+
 def test_is_subclass():
     assert is_subclass(type(None), None)
     assert is_subclass(type(None), (None,))
@@ -329,5 +367,58 @@ def test_typing_type():
     assert is_instance(Parent.Child(), tippo.Optional[nested_cls_path])
 
 
+def test_typing_union_order():
+    # Unions compare equal regardless of order, but are checked in their own order.
+    if sys.version_info[:2] >= (3, 9):
+        with pytest.raises(ImportError):
+            is_instance([3], list[tippo.Union["module.module.Cls", int]])
+        assert is_instance([3], list[tippo.Union[int, "module.module.Cls"]]) is True
+
+
+def test_typing_any_items():
+    assert is_instance({"a": 1}, tippo.Mapping[tippo.Any, tippo.Any])
+    assert is_instance({"a": 1}, tippo.Dict[str, tippo.Any])
+    assert is_instance({"a": 1}, tippo.Dict[object, int])
+    assert is_instance([1, "a"], tippo.List[tippo.Any])
+    assert is_instance([1, "a"], tippo.Iterable[object])
+
+    assert not is_instance({"a": 1}, tippo.Dict[int, tippo.Any])
+    assert not is_instance({"a": 1}, tippo.Dict[tippo.Any, str])
+    assert not is_instance((1, "a"), tippo.List[tippo.Any])
+
+
+def test_typing_plain_items():
+    assert is_instance([1, True], tippo.List[int])
+    assert not is_instance([1, True], tippo.List[int], subtypes=False)
+    assert is_instance({1: [1]}, tippo.Dict[int, list], subtypes=False)
+    assert not is_instance({1: [1]}, tippo.Dict[int, tuple], subtypes=False)
+    assert is_instance((SubCls(), Cls()), tippo.Tuple[Cls, ...])
+    assert not is_instance((SubCls(), Cls()), tippo.Tuple[Cls, ...], subtypes=False)
+    assert is_instance((1, "a"), tippo.Tuple[int, str], subtypes=False)
+    assert not is_instance((True, "a"), tippo.Tuple[int, str], subtypes=False)
+    assert is_instance((True, "a"), tippo.Tuple[int, str])
+    assert not is_instance((1, 2), tippo.Tuple[int, str])
+
+
+def test_typing_plain_union():
+    assert is_instance(None, tippo.Optional[int])
+    assert is_instance(True, tippo.Optional[int])
+    assert not is_instance(True, tippo.Optional[int], subtypes=False)
+    assert is_instance(SubCls(), tippo.Union[Cls, int])
+    assert not is_instance(SubCls(), tippo.Union[Cls, int], subtypes=False)
+    assert is_instance(3, tippo.Union[str, object], subtypes=False)
+
+
+def test_typing_type_any():
+    assert is_instance(int, tippo.Type[tippo.Any])
+    assert is_instance(int, tippo.Type[object])
+    assert not is_instance(3, tippo.Type[tippo.Any])
+    assert not is_instance(3, tippo.Type[object])
+    assert is_instance(type, tippo.Type[tippo.Type[object]])
+    assert not is_instance(int, tippo.Type[tippo.Type[object]])
+    assert is_subclass(abc.ABCMeta, tippo.Type[object])
+    assert not is_subclass(int, tippo.Type[object])
+
+
 if __name__ == "__main__":
     pytest.main()